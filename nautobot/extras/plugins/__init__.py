@@ -1,5 +1,7 @@
 import collections
+import functools
 import inspect
+import sys
 from packaging import version
 
 from django.apps import AppConfig
@@ -274,6 +276,18 @@ def register_jobs(class_list):
 #
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_permissions(permissions):
+    """
+    Return a canonical frozenset of the given tuple of permission names, so that menu items and buttons requiring the
+    same permissions share a single immutable set rather than each holding their own list.
+
+    The permission names themselves are interned, so that comparing them against the user's permissions can
+    short-circuit on identity.
+    """
+    return frozenset(sys.intern(permission) for permission in permissions)
+
+
 class PluginMenuItem:
     """
     This class represents a navigation menu item. This constitutes primary link and its text, but also allows for
@@ -283,20 +297,21 @@ class PluginMenuItem:
     Buttons are each specified as a list of PluginMenuButton instances.
     """
 
-    permissions = []
-    buttons = []
+    __slots__ = ("link", "link_text", "permissions", "buttons")
 
     def __init__(self, link, link_text, permissions=None, buttons=None):
         self.link = link
         self.link_text = link_text
+        self.permissions = frozenset()
+        self.buttons = ()
         if permissions is not None:
             if type(permissions) not in (list, tuple):
                 raise TypeError("Permissions must be passed as a tuple or list.")
-            self.permissions = permissions
+            self.permissions = _shared_permissions(tuple(permissions))
         if buttons is not None:
             if type(buttons) not in (list, tuple):
                 raise TypeError("Buttons must be passed as a tuple or list.")
-            self.buttons = buttons
+            self.buttons = tuple(buttons)
 
 
 class PluginMenuButton:
@@ -305,17 +320,18 @@ class PluginMenuButton:
     ButtonColorChoices.
     """
 
-    color = ButtonColorChoices.DEFAULT
-    permissions = []
+    __slots__ = ("link", "title", "icon_class", "color", "permissions")
 
     def __init__(self, link, title, icon_class, color=None, permissions=None):
         self.link = link
         self.title = title
         self.icon_class = icon_class
+        self.color = ButtonColorChoices.DEFAULT
+        self.permissions = frozenset()
         if permissions is not None:
             if type(permissions) not in (list, tuple):
                 raise TypeError("Permissions must be passed as a tuple or list.")
-            self.permissions = permissions
+            self.permissions = _shared_permissions(tuple(permissions))
         if color is not None:
             if color not in ButtonColorChoices.values():
                 raise ValueError("Button color must be a choice within ButtonColorChoices.")
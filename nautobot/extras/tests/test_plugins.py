@@ -1,3 +1,4 @@
+import sys
 from unittest import skipIf
 
 from django.conf import settings
@@ -66,6 +67,35 @@ class PluginTest(TestCase):
         self.assertEqual(len(menu_items), 2)
         self.assertEqual(len(menu_items[0].buttons), 2)
 
+    def test_menu_item_permissions(self):
+        """
+        Check that equal menu item and button permissions are stored as a single shared frozenset.
+        """
+        from nautobot.extras.plugins import PluginMenuButton, PluginMenuItem
+
+        button = PluginMenuButton(
+            link="admin:dummy_plugin_dummymodel_add",
+            title="Add a new dummy model",
+            icon_class="mdi mdi-plus-thick",
+            permissions=["dummy_plugin.add_dummymodel"],
+        )
+        item = PluginMenuItem(
+            link="plugins:dummy_plugin:dummy_models",
+            link_text="Item 1",
+            permissions=["dummy_plugin.view_dummymodel"],
+            buttons=[button],
+        )
+        other_item = PluginMenuItem(
+            link="plugins:dummy_plugin:dummy_models",
+            link_text="Item 2",
+            permissions=("dummy_plugin.view_dummymodel",),
+        )
+        self.assertEqual(item.permissions, frozenset(["dummy_plugin.view_dummymodel"]))
+        self.assertIs(item.permissions, other_item.permissions)
+        self.assertIs(next(iter(item.permissions)), sys.intern("dummy_plugin.view_dummymodel"))
+        self.assertEqual(item.buttons, (button,))
+        self.assertEqual(button.permissions, frozenset(["dummy_plugin.add_dummymodel"]))
+
     def test_template_extensions(self):
         """
         Check that plugin TemplateExtensions are registered.
@@ -12,13 +12,20 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from distutils.util import strtobool
+import functools
 from invoke import Collection, task as invoke_task
 from invoke.exceptions import Exit
 import os
-import requests
-from time import sleep
+import shlex
+import shutil
+import socket
+import subprocess
+import sys
+import time
 import toml
+from types import MappingProxyType
 
 
 def is_truthy(arg):
@@ -48,6 +55,8 @@ namespace.configure(
             "compose_dir": os.path.join(os.path.dirname(__file__), "development/"),
             "compose_file": "docker-compose.yml",
             "compose_override_file": "docker-compose.dev.yml",
+            # Docker Compose executable, e.g. "docker-compose" or "docker compose"; None to auto-detect
+            "compose_command": None,
             "docker_image_names_main": [
                 "networktocode/nautobot",
                 "ghcr.io/nautobot/nautobot",
@@ -84,38 +93,297 @@ def task(function=None, *args, **kwargs):
     return task_wrapper
 
 
-def docker_compose(context, command, **kwargs):
+@functools.lru_cache(maxsize=None)
+def _compose_prefix(compose_command):
+    """Return the Docker Compose executable to use.
+
+    Unless `compose_command` is configured explicitly, this prefers the Compose v2 `docker compose` plugin if it is
+    installed, since the standalone `docker-compose` (Compose v1) is written in Python and is markedly slower to start.
+    """
+    if compose_command:
+        return tuple(shlex.split(compose_command))
+    if shutil.which("docker"):
+        result = subprocess.run(["docker", "compose", "version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if result.returncode == 0:
+            return ("docker", "compose")
+    return ("docker-compose",)
+
+
+@functools.lru_cache(maxsize=None)
+def _compose_argv(compose_command, project_name, compose_dir, compose_file, compose_override_file):
+    """Build the base "docker compose ..." (or "docker-compose ...") argument list for the given configuration.
+
+    The result is cached, so the compose override file is only looked up on disk once per configuration,
+    rather than on every docker-compose invocation.
+    """
+    compose_argv = [
+        *_compose_prefix(compose_command),
+        "--project-name",
+        project_name,
+        "--project-directory",
+        compose_dir,
+        "-f",
+        os.path.join(compose_dir, compose_file),
+    ]
+    compose_override_path = os.path.join(compose_dir, compose_override_file)
+    if os.path.isfile(compose_override_path):
+        compose_argv += ["-f", compose_override_path]
+    return tuple(compose_argv)
+
+
+@functools.lru_cache(maxsize=None)
+def _run_env(python_ver):
+    """Return the environment variables to set for docker commands using the given Python version.
+
+    The mapping is read-only, so that a single instance can safely be shared between all calls.
+    """
+    return MappingProxyType({"PYTHON_VER": python_ver})
+
+
+def join_argv(argv):
+    """Join an argument list into a single, properly quoted, shell command string."""
+    return " ".join(shlex.quote(arg) for arg in argv)
+
+
+def display_argv(argv):
+    """Join an argument list into a human-readable command string, for messages only.
+
+    Unlike join_argv(), arguments are not shell-escaped; only those containing whitespace are wrapped in quotes, so
+    that e.g. an --entrypoint command stays readable rather than being full of nested escapes.
+    """
+    return " ".join(f"'{arg}'" if any(char.isspace() for char in arg) else arg for arg in argv)
+
+
+def as_argv(command):
+    """Return the given command as an argument list, splitting it (per shell quoting rules) if given as a string."""
+    if isinstance(command, str):
+        return shlex.split(command)
+    return list(command)
+
+
+def raw_run(context, argv, env):
+    """Run a command directly, without a shell, with its output going straight to this process's stdout/stderr.
+
+    Unlike context.run(), the output is not captured or relayed line by line through Python; the child process inherits
+    our file descriptors. Raises Exit with the command's exit code if it fails, unless `run.warn` is configured.
+
+    The `run.dry`, `run.echo` and `run.env` invoke settings (e.g. `invoke --dry` or `invoke --echo`) are honored as
+    context.run() would: in dry mode the command is only printed, not run.
+
+    On Ctrl-C the terminal delivers SIGINT to the child as well, so rather than killing it we keep waiting for it to
+    shut down on its own terms (e.g. docker-compose gracefully stopping the containers it started).
+
+    Args:
+        context (obj): Used to look up the invoke `run` configuration
+        argv (list): Command and its arguments
+        env (Mapping): Environment variables to set for the command, on top of the current and configured environment
+    """
+    run_config = context.config.run
+    if run_config.dry or run_config.echo:
+        # Same formatting as invoke's own command echo
+        print(f"\033[1;37m{join_argv(argv)}\033[0m")
+    if run_config.dry:
+        return None
+    try:
+        process = subprocess.Popen(argv, env={**os.environ, **run_config.env, **env})
+    except FileNotFoundError:
+        raise Exit(f"{argv[0]}: command not found", 127)
+    while True:
+        try:
+            process.wait()
+            break
+        except KeyboardInterrupt:
+            continue
+    if process.returncode and not run_config.warn:
+        raise Exit(code=process.returncode)
+    return process
+
+
+def raw_exec(context, argv, env=None):
+    """Replace the current process with the given command; this function does not return, except in dry mode.
+
+    As with raw_run(), the `run.dry`, `run.echo` and `run.env` invoke settings are honored: in dry mode the command is
+    only printed, and this function returns without running it.
+
+    Args:
+        context (obj): Used to look up the invoke `run` configuration
+        argv (list): Command and its arguments
+        env (Mapping): Environment variables to set for the command, on top of the current and configured environment
+    """
+    run_config = context.config.run
+    if run_config.dry or run_config.echo:
+        # Same formatting as invoke's own command echo
+        print(f"\033[1;37m{join_argv(argv)}\033[0m")
+    if run_config.dry:
+        return
+    sys.stdout.flush()
+    try:
+        os.execvpe(argv[0], argv, {**os.environ, **run_config.env, **(env or {})})
+    except FileNotFoundError:
+        raise Exit(f"{argv[0]}: command not found", 127)
+
+
+def compose_argv(context):
+    """Return the base "docker-compose ..." argument list for the current configuration."""
+    return _compose_argv(
+        context.nautobot.compose_command,
+        context.nautobot.project_name,
+        context.nautobot.compose_dir,
+        context.nautobot.compose_file,
+        context.nautobot.compose_override_file,
+    )
+
+
+def docker_compose(context, command, banner=True, **kwargs):
     """Helper function for running a specific docker-compose command with all appropriate parameters and environment.
 
+    When no kwargs are given, docker-compose is executed directly (without a shell) via raw_run() and its output is
+    streamed to the terminal; otherwise the command is run via context.run() so that options such as `pty` and `hide`
+    are honored.
+
     Args:
         context (obj): Used to run specific commands
-        command (str): Command string to append to the "docker-compose ..." command, such as "build", "up", etc.
+        command (str or list): Command string or argument list to append to the "docker-compose ..." command, such as
+            "build", "up", etc.
+        banner (bool): Whether to print which docker-compose command is being run
         **kwargs: Passed through to the context.run() call.
     """
-    compose_file_path = os.path.join(context.nautobot.compose_dir, context.nautobot.compose_file)
-    compose_command = f'docker-compose --project-name {context.nautobot.project_name} --project-directory "{context.nautobot.compose_dir}" -f "{compose_file_path}"'
-    compose_override_path = os.path.join(context.nautobot.compose_dir, context.nautobot.compose_override_file)
-    if os.path.isfile(compose_override_path):
-        compose_command += f' -f "{compose_override_path}"'
-    compose_command += f" {command}"
-    print(f'Running docker-compose command "{command}"')
-    return context.run(compose_command, env={"PYTHON_VER": context.nautobot.python_ver}, **kwargs)
+    command_argv = as_argv(command)
+    argv = [*compose_argv(context), *command_argv]
+    if banner:
+        print(f'Running docker-compose command "{display_argv(command_argv)}"')
+    env = _run_env(context.nautobot.python_ver)
+    if not kwargs:
+        return raw_run(context, argv, env)
+    return context.run(join_argv(argv), env=env, **kwargs)
 
 
-def run_command(context, command, **kwargs):
-    """Wrapper to run a command locally or inside the nautobot container."""
-    if is_truthy(context.nautobot.local):
-        context.run(command, **kwargs)
-    else:
-        # Check if Nautobot is running; no need to start another Nautobot container to run a command
+def exec_docker_compose(context, argv):
+    """Replace the current (invoke) process with the given docker-compose command.
+
+    Intended for interactive commands that are the final step of a task: rather than relaying the session through
+    invoke's pseudo-terminal handling, docker-compose gets the real terminal. This function does not return, except in
+    dry mode (see raw_exec()).
+
+    Args:
+        context (obj): Used to run specific commands
+        argv (list): Arguments to append to the "docker-compose ..." command, such as ["exec", "nautobot", "bash"]
+    """
+    exec_argv = [*compose_argv(context), *argv]
+    print(f'Running docker-compose command "{display_argv(argv)}"')
+    raw_exec(context, exec_argv, _run_env(context.nautobot.python_ver))
+
+
+# Whether the nautobot service is running, keyed by compose project name; see is_nautobot_running()
+_nautobot_running = {}
+
+
+def is_nautobot_running(context):
+    """Check whether the nautobot container is currently running.
+
+    The docker-compose probe is only made once per project within a single invoke run; tasks that start or stop the
+    containers reset the cached answer.
+    """
+    project_name = context.nautobot.project_name
+    if project_name not in _nautobot_running:
         docker_compose_status = "ps --services --filter status=running"
         results = docker_compose(context, docker_compose_status, hide="out")
-        if "nautobot" in results.stdout:
-            compose_command = f"exec nautobot {command}"
+        _nautobot_running[project_name] = "nautobot" in results.stdout.split()
+    return _nautobot_running[project_name]
+
+
+def run_command(context, command, no_deps=False, banner=True, **kwargs):
+    """Wrapper to run a command locally or inside the nautobot container.
+
+    Args:
+        context (obj): Used to run specific commands
+        command (str or list): Command string or argument list to run
+        no_deps (bool): If a new nautobot container has to be started for the command, don't start its dependent
+            services (database, redis, etc.) along with it; for commands such as linters that don't need them
+        banner (bool): Whether to print which docker-compose command is being run, when not running locally
+        **kwargs: Passed through to the context.run() call.
+    """
+    argv = as_argv(command)
+    if is_truthy(context.nautobot.local):
+        return context.run(join_argv(argv), **kwargs)
+    else:
+        pty = kwargs.pop("pty", True)
+        # Without a pseudo-terminal (e.g. when capturing output) docker-compose must not try to allocate a TTY either
+        tty_options = [] if pty else ["-T"]
+        # If Nautobot is running, no need to start another Nautobot container to run a command
+        if is_nautobot_running(context):
+            compose_command = ["exec", *tty_options, "nautobot", *argv]
         else:
-            compose_command = f"run --entrypoint '{command}' nautobot"
+            run_options = ["--rm", "--no-deps"] if no_deps else ["--rm"]
+            compose_command = ["run", *run_options, *tty_options, "--entrypoint", join_argv(argv), "nautobot"]
+
+        return docker_compose(context, compose_command, banner=banner, pty=pty, **kwargs)
+
+
+def exec_command(context, command):
+    """Replace the current (invoke) process with a command run locally or inside the nautobot container.
+
+    Like run_command(), but for interactive commands that are the final step of a task, so that the command gets the
+    real terminal instead of having its session relayed through invoke. This function does not return, except in dry
+    mode (see raw_exec()).
+    """
+    argv = as_argv(command)
+    if is_truthy(context.nautobot.local):
+        raw_exec(context, argv)
+    elif is_nautobot_running(context):
+        exec_docker_compose(context, ["exec", "nautobot", *argv])
+    else:
+        exec_docker_compose(context, ["run", "--rm", "--entrypoint", join_argv(argv), "nautobot"])
+
 
-        docker_compose(context, compose_command, pty=True)
+def run_concurrently(context, runners):
+    """Run several independent commands at once, then report their output.
+
+    Each command's output is captured and printed in one piece as soon as it completes, so that the output of
+    concurrent commands is not interleaved. Raises Exit once all commands are done if any of them failed.
+
+    If a new nautobot container is needed for the commands, the first one is run on its own before the others, so that
+    only it creates the project's network: concurrent "docker-compose run"s could each try to create it, and end up
+    with several networks of the same name.
+
+    Args:
+        context (obj): Used to run specific commands
+        runners (dict): Mapping of a display name to a callable running the command, which must accept and pass on
+            keyword arguments for the context.run() call, and must not print anything itself, such as a
+            functools.partial() of run_command() with `banner=False`
+    """
+    run_kwargs = {"hide": True, "warn": True, "pty": False, "in_stream": False}
+    pending = list(runners.items())
+    failed = []
+
+    def report(name, result):
+        print(result.stdout, end="")
+        print(result.stderr, end="", file=sys.stderr)
+        if result.failed:
+            failed.append(name)
+
+    # Probe for a running container up front, rather than from every worker thread at once
+    if not is_truthy(context.nautobot.local) and not is_nautobot_running(context):
+        name, runner = pending.pop(0)
+        print(f"Running {name}...")
+        report(name, runner(**run_kwargs))
+
+    print(f"Running {', '.join(name for name, _ in pending)} concurrently...")
+    with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+        futures = {executor.submit(runner, **run_kwargs): name for name, runner in pending}
+        for future in as_completed(futures):
+            report(futures[future], future.result())
+
+    if failed:
+        raise Exit(f"Failed: {', '.join(sorted(failed))}", 1)
+
+
+def run_hadolint(context, **kwargs):
+    """Run hadolint against the Dockerfile, locally or in the (much smaller and quicker to start) hadolint image."""
+    if is_truthy(context.nautobot.local):
+        return context.run(HADOLINT_COMMAND, **kwargs)
+    dockerfile = os.path.join(os.path.dirname(os.path.abspath(__file__)), "docker", "Dockerfile")
+    return context.run(f"docker run --rm -i {HADOLINT_IMAGE} hadolint - < {shlex.quote(dockerfile)}", **kwargs)
 
 
 # ------------------------------------------------------------------------------
@@ -129,12 +397,12 @@ def run_command(context, command, **kwargs):
 )
 def build(context, force_rm=False, cache=True):
     """Build Nautobot docker image."""
-    command = f"build --build-arg PYTHON_VER={context.nautobot.python_ver}"
+    command = ["build", "--build-arg", f"PYTHON_VER={context.nautobot.python_ver}"]
 
     if not cache:
-        command += " --no-cache"
+        command.append("--no-cache")
     if force_rm:
-        command += " --force-rm"
+        command.append("--force-rm")
 
     print(f"Building Nautobot with Python {context.nautobot.python_ver}...")
     docker_compose(context, command)
@@ -165,7 +433,7 @@ def buildx(
     else:
         command += f" --cache-to type=local,dest={cache_dir}/{context.nautobot.python_ver} --cache-from type=local,src={cache_dir}/{context.nautobot.python_ver}"
 
-    context.run(command, env={"PYTHON_VER": context.nautobot.python_ver})
+    context.run(command, env=_run_env(context.nautobot.python_ver))
 
 
 @task(
@@ -231,6 +499,7 @@ def docker_push(context, branch, commit="", datestamp=""):
 def debug(context):
     """Start Nautobot and its dependencies in debug mode."""
     print("Starting Nautobot in debug mode...")
+    _nautobot_running.clear()
     docker_compose(context, "up")
 
 
@@ -238,6 +507,7 @@ def debug(context):
 def start(context):
     """Start Nautobot and its dependencies in detached mode."""
     print("Starting Nautobot in detached mode...")
+    _nautobot_running.clear()
     docker_compose(context, "up --detach")
 
 
@@ -252,6 +522,7 @@ def restart(context):
 def stop(context):
     """Stop Nautobot and its dependencies."""
     print("Stopping Nautobot...")
+    _nautobot_running.clear()
     docker_compose(context, "down")
 
 
@@ -259,6 +530,7 @@ def stop(context):
 def destroy(context):
     """Destroy all containers and volumes."""
     print("Destroying Nautobot...")
+    _nautobot_running.clear()
     docker_compose(context, "down --volumes")
 
 
@@ -278,13 +550,13 @@ def nbshell(context):
     """Launch an interactive nbshell session."""
     command = "nautobot-server nbshell"
 
-    run_command(context, command, pty=True)
+    exec_command(context, command)
 
 
 @task
 def cli(context):
     """Launch a bash shell inside the running Nautobot container."""
-    docker_compose(context, "exec nautobot bash", pty=True)
+    exec_docker_compose(context, ["exec", "nautobot", "bash"])
 
 
 @task(
@@ -294,9 +566,9 @@ def cli(context):
 )
 def createsuperuser(context, user="admin"):
     """Create a new Nautobot superuser account (default: "admin"), will prompt for password."""
-    command = f"nautobot-server createsuperuser --username {user}"
+    command = ["nautobot-server", "createsuperuser", "--username", user]
 
-    run_command(context, command)
+    exec_command(context, command)
 
 
 @task(
@@ -306,10 +578,10 @@ def createsuperuser(context, user="admin"):
 )
 def makemigrations(context, name=""):
     """Perform makemigrations operation in Django."""
-    command = "nautobot-server makemigrations"
+    command = ["nautobot-server", "makemigrations"]
 
     if name:
-        command += f" --name {name}"
+        command += ["--name", name]
 
     run_command(context, command)
 
@@ -344,6 +616,14 @@ def post_upgrade(context):
 # ------------------------------------------------------------------------------
 # TESTS
 # ------------------------------------------------------------------------------
+PYTHON_LINT_PATHS = "development/ nautobot/ tasks.py"
+BLACK_CHECK_COMMAND = f"black --check --diff {PYTHON_LINT_PATHS}"
+FLAKE8_COMMAND = f"flake8 {PYTHON_LINT_PATHS}"
+HADOLINT_COMMAND = "hadolint docker/Dockerfile"
+# Keep in sync with the hadolint version installed in docker/Dockerfile
+HADOLINT_IMAGE = "hadolint/hadolint:v2.0.0"
+
+
 @task(
     help={
         "autoformat": "Apply formatting recommendations automatically, rather than failing if formatting is incorrect.",
@@ -352,27 +632,23 @@ def post_upgrade(context):
 def black(context, autoformat=False):
     """Check Python code style with Black."""
     if autoformat:
-        black_command = "black"
+        command = f"black {PYTHON_LINT_PATHS}"
     else:
-        black_command = "black --check --diff"
+        command = BLACK_CHECK_COMMAND
 
-    command = f"{black_command} development/ nautobot/ tasks.py"
-
-    run_command(context, command)
+    run_command(context, command, no_deps=True)
 
 
 @task
 def flake8(context):
     """Check for PEP8 compliance and other style issues."""
-    command = "flake8 development/ nautobot/ tasks.py"
-    run_command(context, command)
+    run_command(context, FLAKE8_COMMAND, no_deps=True)
 
 
 @task
 def hadolint(context):
     """Check Dockerfile for hadolint compliance and other style issues."""
-    command = "hadolint docker/Dockerfile"
-    run_command(context, command)
+    run_hadolint(context)
 
 
 @task
@@ -389,52 +665,115 @@ def check_migrations(context):
         "label": "specify a directory or module to test instead of running all Nautobot tests",
         "failfast": "fail as soon as a single test fails don't run the entire test suite",
         "buffer": "Discard output from passing tests",
+        "parallel": "number of test processes to run in parallel (0 to use one per CPU core; default: 1, i.e. serial)",
     }
 )
-def unittest(context, keepdb=False, label="nautobot", failfast=False, buffer=True):
+def unittest(context, keepdb=False, label="nautobot", failfast=False, buffer=True, parallel=1):
     """Run Nautobot unit tests."""
-    command = f"coverage run --module nautobot.core.cli test {label} --config=nautobot/core/tests/nautobot_config.py"
+    if parallel < 0:
+        raise Exit(f"Invalid number of parallel test processes ({parallel}); use 0 for one per CPU core", 1)
+
+    command = [
+        "coverage",
+        "run",
+        "--module",
+        "nautobot.core.cli",
+        "test",
+        label,
+        "--config=nautobot/core/tests/nautobot_config.py",
+    ]
 
     if keepdb:
-        command += " --keepdb"
+        command.append("--keepdb")
     if failfast:
-        command += " --failfast"
+        command.append("--failfast")
     if buffer:
-        command += " --buffer"
-    run_command(context, command)
+        command.append("--buffer")
+    if parallel == 1:
+        run_command(context, command)
+        return
+
+    # Each test process records its own coverage data file, which need to be merged afterwards
+    command.insert(2, "--parallel-mode")
+    if parallel == 0:
+        command.append("--parallel")
+    else:
+        command += ["--parallel", str(parallel)]
+    result = run_command(context, command, warn=True)
+
+    # Combine even if tests failed, so that no stale data files are left behind to pollute the next report
+    run_command(context, ["coverage", "combine"])
+    if result.failed:
+        raise Exit(code=result.exited)
 
 
 @task
 def unittest_coverage(context):
     """Report on code test coverage as measured by 'invoke unittest'."""
-    command = "coverage report --skip-covered --include 'nautobot/*' --omit *migrations*"
+    command = ["coverage", "report", "--skip-covered", "--include", "nautobot/*", "--omit", "*migrations*"]
 
     run_command(context, command)
 
 
-@task
-def integration_tests(context):
+def wait_for_port(host, port, timeout, interval=0.05):
+    """Poll until a TCP connection to the given host and port succeeds.
+
+    Returns True once the port accepts connections, or False if it still doesn't after `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
+
+@task(
+    help={
+        "timeout": "seconds to wait for Nautobot to start accepting connections (default: 300)",
+    }
+)
+def integration_tests(context, timeout=300):
     """Some very generic high level integration tests."""
+    # requests is only needed here, so don't make every other task pay for importing it
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class ReadinessRetry(Retry):
+        """Retry policy used while waiting for Nautobot to come up, with its exponential backoff capped at 5 seconds."""
+
+        def get_backoff_time(self):
+            return min(super().get_backoff_time(), 5)
+
+    retries = ReadinessRetry(
+        total=60,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["HEAD", "GET"],
+    )
+    # All requests made against Nautobot share this session's pool of keep-alive connections
     session = requests.Session()
-    retries = 1
-    max_retries = 60
+    session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retries))
 
     start(context)
-    while retries < max_retries:
-        try:
-            response = session.get("http://localhost:8080", timeout=5)
-        except requests.exceptions.ConnectionError:
-            print("Nautobot not ready yet sleeping for 5 seconds...")
-            sleep(5)
-            retries += 1
-            continue
-        if response.ok:
-            print("Nautobot is ready...")
-            break
-        else:
-            raise Exit(f"Nautobot returned and invalid status {response.status_code}", 1)
-    if retries >= max_retries:
+    print("Waiting for Nautobot to accept connections...")
+    # Without Docker's userland proxy, the port only opens once the container's startup migrations have completed
+    if not wait_for_port("localhost", 8080, timeout=timeout):
+        raise Exit("Timed out waiting for Nautobot", 1)
+
+    # The port may be open (e.g. by Docker's port forwarding) before Nautobot can actually serve requests
+    print("Waiting for Nautobot to be ready...")
+    try:
+        response = session.head("http://localhost:8080", timeout=(2, 2))
+    except requests.exceptions.RequestException:
         raise Exit("Timed out waiting for Nautobot", 1)
+    if not response.ok:
+        raise Exit(f"Nautobot returned and invalid status {response.status_code}", 1)
+    print("Nautobot is ready...")
 
 
 @task(
@@ -444,9 +783,15 @@ def integration_tests(context):
 )
 def tests(context, lint_only=False):
     """Run all tests and linters."""
-    black(context)
-    flake8(context)
-    hadolint(context)
+    # The linters are read-only and independent of each other, so run them in parallel
+    run_concurrently(
+        context,
+        {
+            "black": functools.partial(run_command, context, BLACK_CHECK_COMMAND, no_deps=True, banner=False),
+            "flake8": functools.partial(run_command, context, FLAKE8_COMMAND, no_deps=True, banner=False),
+            "hadolint": functools.partial(run_hadolint, context),
+        },
+    )
     check_migrations(context)
     if not lint_only:
         unittest(context)